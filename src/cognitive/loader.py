@@ -26,11 +26,21 @@ Format v0 (old, deprecated):
 """
 
 import json
+import os
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Literal
 
 import yaml
 
+# Shared immutable default for `.get(x) or _EMPTY` chains: avoids building
+# a throwaway dict on every call when a manifest section is absent.
+_EMPTY = MappingProxyType({})
+
+# Prefer the libyaml C loader when available; safe_load always routes
+# through the pure-Python one.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 # =============================================================================
 # Type Definitions (v2.2)
@@ -47,11 +57,19 @@ EnumStrategy = Literal["strict", "extensible"]
 
 def detect_format(module_path: Path) -> str:
     """Detect module format: 'v2', 'v1', or 'v0'."""
-    if (module_path / "module.yaml").exists():
+    # One directory scan answers all three marker probes instead of up to
+    # three exists() syscalls.
+    try:
+        with os.scandir(module_path) as it:
+            names = {entry.name for entry in it}
+    except OSError:
+        names = set()
+
+    if "module.yaml" in names:
         return "v2"
-    elif (module_path / "MODULE.md").exists():
+    elif "MODULE.md" in names:
         return "v1"
-    elif (module_path / "module.md").exists():
+    elif "module.md" in names:
         return "v0"
     else:
         raise FileNotFoundError(f"No module.yaml, MODULE.md, or module.md found in {module_path}")
@@ -78,12 +96,14 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if not content.startswith('---'):
         return {}, content
     
-    parts = content.split('---', 2)
-    if len(parts) < 3:
+    # Indexed slicing instead of split('---', 2): no three-element list,
+    # and the scan stops at the closing delimiter.
+    end = content.find('---', 3)
+    if end < 0:
         return {}, content
-    
-    frontmatter = yaml.safe_load(parts[1]) or {}
-    body = parts[2].strip()
+
+    frontmatter = yaml.load(content[3:end], Loader=_YAML_SAFE_LOADER) or {}
+    body = content[end + 3:].strip()
     return frontmatter, body
 
 
@@ -95,7 +115,7 @@ def load_v2_format(module_path: Path) -> dict:
     """Load module in v2.x format (module.yaml + prompt.md + schema.json)."""
     # Load module.yaml
     with open(module_path / "module.yaml", 'r', encoding='utf-8') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     
     # Detect version
     version_str = detect_v2_version(manifest)
@@ -331,7 +351,7 @@ def load_v0_format(module_path: Path) -> dict:
     
     # Load constraints
     with open(module_path / "constraints.yaml", 'r', encoding='utf-8') as f:
-        constraints = yaml.safe_load(f)
+        constraints = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     
     # Load prompt
     with open(module_path / "prompt.txt", 'r', encoding='utf-8') as f:
@@ -423,17 +443,14 @@ def get_schema_strictness(module: dict) -> SchemaStrictness:
 
 def is_overflow_enabled(module: dict) -> bool:
     """Check if overflow (extensions.insights) is enabled."""
-    overflow = module.get("overflow", {})
-    return overflow.get("enabled", False)
+    return (module.get("overflow") or _EMPTY).get("enabled", False)
 
 
 def get_enum_strategy(module: dict) -> EnumStrategy:
     """Get enum extension strategy."""
-    enums = module.get("enums", {})
-    return enums.get("strategy", "strict")
+    return (module.get("enums") or _EMPTY).get("strategy", "strict")
 
 
 def should_auto_wrap(module: dict) -> bool:
     """Check if runtime should auto-wrap v2.1 to v2.2."""
-    compat = module.get("compat", {})
-    return compat.get("runtime_auto_wrap", True)
+    return (module.get("compat") or _EMPTY).get("runtime_auto_wrap", True)
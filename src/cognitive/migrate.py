@@ -19,6 +19,9 @@ import yaml
 from .registry import find_module, list_modules
 from .loader import detect_format, parse_frontmatter
 
+# libyaml C loader when present; safe_load only ever uses the Python one.
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 # =============================================================================
 # Migration Entry Points
@@ -63,7 +66,7 @@ def migrate_module(
         module_yaml_path = module_path / "module.yaml"
         if module_yaml_path.exists():
             with open(module_yaml_path, 'r', encoding='utf-8') as f:
-                manifest = yaml.safe_load(f)
+                manifest = yaml.load(f, Loader=_YAML_SAFE_LOADER)
             if manifest.get('tier') is not None:
                 warnings.append("Module appears to already be v2.2 format")
                 return True, [], warnings
@@ -235,7 +238,7 @@ def _migrate_from_v2(
     # Load module.yaml
     module_yaml_path = module_path / "module.yaml"
     with open(module_yaml_path, 'r', encoding='utf-8') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=_YAML_SAFE_LOADER)
     
     # Load schema.json
     schema_path = module_path / "schema.json"
@@ -8,9 +8,23 @@ Supports both synchronous and streaming modes:
 
 import json
 import os
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Optional, Iterator
 
+# Per-context provider/model overrides. These take precedence over the
+# LLM_PROVIDER / LLM_MODEL environment variables and allow concurrent
+# callers (e.g. server requests) to select a provider without mutating
+# process-global state.
+_PROVIDER_VAR: ContextVar[Optional[str]] = ContextVar("llm_provider", default=None)
+_MODEL_VAR: ContextVar[Optional[str]] = ContextVar("llm_model", default=None)
+
+
+def _current_provider() -> str:
+    """Resolve the active provider: contextvar first, then environment."""
+    provider = _PROVIDER_VAR.get() or os.environ.get("LLM_PROVIDER", "stub")
+    return provider.lower()
+
 
 def call_llm(prompt: str, model: Optional[str] = None) -> str:
     """
@@ -28,8 +42,9 @@ def call_llm(prompt: str, model: Optional[str] = None) -> str:
     Returns:
         The LLM's response as a string
     """
-    provider = os.environ.get("LLM_PROVIDER", "stub").lower()
-    
+    provider = _current_provider()
+    model = model or _MODEL_VAR.get()
+
     if provider == "openai":
         return _call_openai(prompt, model)
     elif provider == "anthropic":
@@ -55,8 +70,9 @@ def call_llm_stream(prompt: str, model: Optional[str] = None) -> Iterator[str]:
     Yields:
         String chunks of the LLM's response
     """
-    provider = os.environ.get("LLM_PROVIDER", "stub").lower()
-    
+    provider = _current_provider()
+    model = model or _MODEL_VAR.get()
+
     if provider == "openai":
         yield from _stream_openai(prompt, model)
     elif provider == "anthropic":
@@ -23,6 +23,9 @@ import zipfile
 import io
 import re
 
+# Compiled once: skips the re-cache lookup and hash on every URL parse
+_GITHUB_URL_RE = re.compile(r"https://github\.com/([^/]+)/([^/]+)/?")
+
 # Standard module search paths
 SEARCH_PATHS = [
     Path.cwd() / "cognitive" / "modules",  # Project-local
@@ -191,13 +194,15 @@ def get_installed_module_info(name: str) -> Optional[dict]:
 def get_module_version(module_path: Path) -> Optional[str]:
     """Extract version from a module's metadata."""
     import yaml
-    
+    # Same libyaml-backed loader the other modules use for manifest parsing
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
     # Try v2 format (module.yaml)
     yaml_path = module_path / "module.yaml"
     if yaml_path.exists():
         try:
             with open(yaml_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=loader)
             return data.get("version")
         except:
             pass
@@ -214,7 +219,7 @@ def get_module_version(module_path: Path) -> Optional[str]:
             if content.startswith("---"):
                 parts = content.split("---", 2)
                 if len(parts) >= 3:
-                    meta = yaml.safe_load(parts[1])
+                    meta = yaml.load(parts[1], Loader=loader)
                     return meta.get("version")
         except:
             pass
@@ -294,7 +299,7 @@ def install_from_github_url(
         url = f"https://github.com/{url}"
     
     # Extract org/repo from URL
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?", url)
+    match = _GITHUB_URL_RE.match(url)
     if not match:
         raise ValueError(f"Invalid GitHub URL: {url}")
     
@@ -568,7 +573,7 @@ def list_github_tags(url: str, limit: int = 10) -> list[str]:
     if not url.startswith("http"):
         url = f"https://github.com/{url}"
     
-    match = re.match(r"https://github\.com/([^/]+)/([^/]+)/?", url)
+    match = _GITHUB_URL_RE.match(url)
     if not match:
         raise ValueError(f"Invalid GitHub URL: {url}")
     
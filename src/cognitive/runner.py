@@ -15,15 +15,26 @@ v2.2.1 Features:
   - Streaming support (run_module_stream)
 """
 
-import copy
 import json
+import re
+import sys
 import time
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, TypedDict, Union, Literal, Callable, Iterator
 
-import jsonschema
 import yaml
 
+try:
+    # 3-10x faster response parsing; orjson.JSONDecodeError subclasses
+    # json.JSONDecodeError so existing except clauses keep working
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _json_loads = json.loads
+
 from .registry import find_module
 from .loader import load_module
 from .providers import call_llm
@@ -221,24 +232,25 @@ EnvelopeResponse = Union[EnvelopeResponseV22, EnvelopeSuccessV21, EnvelopeFailur
 # Risk Aggregation
 # =============================================================================
 
-RISK_LEVELS = {"none": 0, "low": 1, "medium": 2, "high": 3}
+# Read-only view: shared module constants must not be mutated by callers.
+RISK_LEVELS = MappingProxyType({"none": 0, "low": 1, "medium": 2, "high": 3})
 RISK_NAMES = ["none", "low", "medium", "high"]
 
 RiskRule = Literal["max_changes_risk", "max_issues_risk", "explicit"]
 
 
+# Bound-method/local references for the aggregation hot loop
+_risk_level = RISK_LEVELS.get
+
+
 def aggregate_risk_from_list(items: list[dict]) -> RiskLevel:
     """Compute max risk from list of items with risk field."""
     if not items:
         return "medium"  # Default conservative
-    
-    max_level = 0
-    for item in items:
-        risk = item.get("risk", "medium")
-        level = RISK_LEVELS.get(risk, 2)
-        max_level = max(max_level, level)
-    
-    return RISK_NAMES[max_level]
+
+    # Single C-level max over a generator; _risk_level avoids re-resolving
+    # RISK_LEVELS.get on every item.
+    return RISK_NAMES[max(_risk_level(item.get("risk"), 2) for item in items)]
 
 
 def aggregate_risk(
@@ -267,6 +279,34 @@ def aggregate_risk(
         return aggregate_risk_from_list(changes)
 
 
+def aggregate_risk_batch(
+    data_list: list[dict],
+    risk_rule: RiskRule = "max_changes_risk"
+) -> list[RiskLevel]:
+    """
+    Compute aggregated risk for many data payloads in one pass.
+
+    Batch counterpart to aggregate_risk for pipelines scoring whole sets
+    of envelopes: the rule is resolved once and the per-item lookups run
+    with pre-bound locals instead of re-dispatching per payload.
+    """
+    if risk_rule == "explicit":
+        return ["medium"] * len(data_list)
+
+    key = "issues" if risk_rule == "max_issues_risk" else "changes"
+    get_level = _risk_level
+    names = RISK_NAMES
+    results = []
+    append = results.append
+    for data in data_list:
+        items = data.get(key)
+        if items:
+            append(names[max(get_level(item.get("risk"), 2) for item in items)])
+        else:
+            append("medium")
+    return results
+
+
 # =============================================================================
 # Error Response Builder
 # =============================================================================
@@ -397,15 +437,73 @@ def make_success_response(
 # Schema Validation
 # =============================================================================
 
+# Compiled validators keyed two ways, mirroring validator.py: an identity
+# map for repeat validations of the same schema object, and a canonical-JSON
+# map so the fresh schema dicts produced by every load_module call reuse one
+# compiled validator instead of growing the cache per request. Both levels
+# are bounded with FIFO eviction, keeping the server hot path leak-free.
+_VALIDATOR_CACHE: dict = {}
+_VALIDATOR_CACHE_BY_CONTENT: dict = {}
+_VALIDATOR_CACHE_MAX = 512
+
+
+def _compiled_validator(schema: dict):
+    """Get (or build and cache) bound validator methods for a schema dict.
+
+    Returns (is_valid, iter_errors) bound methods; caching the bounds
+    skips the per-call attribute lookups on the hot accept path.
+    """
+    key = id(schema)
+    hit = _VALIDATOR_CACHE.get(key)
+    if hit is not None and hit[0] is schema:
+        return hit[1], hit[2]
+
+    # sort_keys makes semantically equal schemas hash to the same key
+    try:
+        content_key = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        content_key = None
+    if content_key is not None:
+        methods = _VALIDATOR_CACHE_BY_CONTENT.get(content_key)
+        if methods is not None:
+            _cache_validator(key, schema, methods)
+            return methods
+
+    import jsonschema  # deferred: only needed when a schema is compiled
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    methods = (validator.is_valid, validator.iter_errors)
+    _cache_validator(key, schema, methods)
+    if content_key is not None:
+        if len(_VALIDATOR_CACHE_BY_CONTENT) >= _VALIDATOR_CACHE_MAX:
+            _VALIDATOR_CACHE_BY_CONTENT.pop(next(iter(_VALIDATOR_CACHE_BY_CONTENT)))
+        _VALIDATOR_CACHE_BY_CONTENT[content_key] = methods
+    return methods
+
+
+def _cache_validator(key: int, schema: dict, methods: tuple) -> None:
+    """Store an identity-cache entry, evicting the oldest at capacity."""
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_MAX:
+        _VALIDATOR_CACHE.pop(next(iter(_VALIDATOR_CACHE)))
+    _VALIDATOR_CACHE[key] = (schema, *methods)
+
+
 def validate_data(data: dict, schema: dict, label: str = "Data") -> list[str]:
     """Validate data against schema. Returns list of errors."""
     errors = []
     if not schema:
         return errors
+    import jsonschema  # deferred: keeps CLI startup off the import cost
     try:
-        jsonschema.validate(instance=data, schema=schema)
-    except jsonschema.ValidationError as e:
-        errors.append(f"{label} validation error: {e.message} at {list(e.absolute_path)}")
+        # Compile once per schema; repeat validations skip schema re-walking.
+        # is_valid short-circuits on the first error, so the common accept
+        # path never builds error objects; only rejects pay for best_match,
+        # which picks the same error jsonschema.validate would raise.
+        is_valid, iter_errors = _compiled_validator(schema)
+        if not is_valid(data):
+            error = jsonschema.exceptions.best_match(iter_errors(data))
+            errors.append(f"{label} validation error: {error.message} at {list(error.absolute_path)}")
     except jsonschema.SchemaError as e:
         errors.append(f"Schema error: {e.message}")
     return errors
@@ -432,16 +530,13 @@ def repair_envelope(
     
     Does NOT repair:
     - Invalid enum values (treated as validation failure)
-    
-    Note: Returns a deep copy to avoid modifying the original data.
+
+    Note: Returns a copy to avoid modifying the original data. Only meta is
+    ever mutated, so a shallow envelope copy plus a fresh meta dict suffice
+    (deepcopy walked the whole payload for nothing).
     """
-    repaired = copy.deepcopy(data)
-    
-    # Ensure meta exists
-    if "meta" not in repaired:
-        repaired["meta"] = {}
-    
-    meta = repaired["meta"]
+    meta = dict(data.get("meta") or {})
+    repaired = {**data, "meta": meta}
     data_payload = repaired.get("data", {})
     
     # Repair confidence
@@ -457,9 +552,11 @@ def repair_envelope(
     if "risk" not in meta:
         meta["risk"] = aggregate_risk(data_payload, risk_rule)
     
-    # Trim whitespace from risk (lossless), but do NOT invent new values
+    # Trim whitespace from risk (lossless), but do NOT invent new values.
+    # Interning the normalized value lets every downstream == against the
+    # literal risk constants resolve on the identity fast path.
     if isinstance(meta.get("risk"), str):
-        meta["risk"] = meta["risk"].strip().lower()
+        meta["risk"] = sys.intern(meta["risk"].strip().lower())
         # If invalid after trim, leave as-is (validation will catch it)
     
     # Repair explain
@@ -471,14 +568,15 @@ def repair_envelope(
         else:
             meta["explain"] = "No explanation provided"
     
-    # Trim whitespace from explain (lossless)
-    if isinstance(meta.get("explain"), str):
-        meta["explain"] = meta["explain"].strip()
-    
-    # Truncate explain if too long
-    if len(meta.get("explain", "")) > max_explain_length:
-        meta["explain"] = meta["explain"][:max_explain_length - 3] + "..."
-    
+    # Trim whitespace (lossless) and truncate if too long — one lookup,
+    # and short explains (the common case) are never re-allocated.
+    explain = meta.get("explain")
+    if isinstance(explain, str):
+        explain = explain.strip()
+        if len(explain) > max_explain_length:
+            explain = explain[:max_explain_length - 3] + "..."
+        meta["explain"] = explain
+
     return repaired
 
 
@@ -488,17 +586,14 @@ def repair_error_envelope(
 ) -> dict:
     """
     Repair error envelope format.
-    
-    Note: Returns a deep copy to avoid modifying the original data.
+
+    Note: Returns a copy to avoid modifying the original data. Only meta
+    is ever written, so a shallow top-level copy plus a copied meta dict
+    is enough — no need to deep-copy the error payload.
     """
-    repaired = copy.deepcopy(data)
-    
-    # Ensure meta exists for errors
-    if "meta" not in repaired:
-        repaired["meta"] = {}
-    
-    meta = repaired["meta"]
-    
+    meta = dict(data.get("meta") or {})
+    repaired = {**data, "meta": meta}
+
     # Set default meta for errors
     if "confidence" not in meta:
         meta["confidence"] = 0.0
@@ -517,12 +612,14 @@ def repair_error_envelope(
 
 def is_envelope_response(data: dict) -> bool:
     """Check if response is in envelope format (v2.1 or v2.2)."""
-    return isinstance(data.get("ok"), bool)
+    # Exact type check: bool has no subclasses in practice and `type is`
+    # skips the isinstance dispatch on this per-response predicate.
+    return type(data.get("ok")) is bool
 
 
 def is_v22_envelope(data: dict) -> bool:
     """Check if response is in v2.2 envelope format (has meta)."""
-    return is_envelope_response(data) and "meta" in data
+    return type(data.get("ok")) is bool and "meta" in data
 
 
 def wrap_v21_to_v22(v21_response: dict) -> EnvelopeResponseV22:
@@ -611,29 +708,40 @@ def convert_legacy_to_envelope(data: dict, is_error: bool = False) -> EnvelopeRe
 # Prompt Building
 # =============================================================================
 
+# Matches $ARGUMENTS, $ARGUMENTS[N] and $N in one scan; the greedy \d+
+# naturally keeps $10 from being read as $1 followed by '0'.
+_ARG_PATTERN = re.compile(r"\$(?:ARGUMENTS(?:\[(\d+)\])?|(\d+))")
+
+
 def substitute_arguments(text: str, input_data: dict) -> str:
     """
     Substitute $ARGUMENTS and $N placeholders in text.
-    
-    Substitution order (important to avoid partial replacements):
-    1. $ARGUMENTS[N] - indexed access (descending order to avoid $1 matching $10)
-    2. $N - shorthand indexed access (descending order)
-    3. $ARGUMENTS - full argument string
+
+    Handles (in a single regex pass instead of one str.replace per word):
+    - $ARGUMENTS[N] - indexed access
+    - $N - shorthand indexed access
+    - $ARGUMENTS - full argument string
     """
     args_value = input_data.get("$ARGUMENTS", input_data.get("query", input_data.get("code", "")))
-    
-    # Replace $ARGUMENTS[N] and $N for indexed access FIRST
-    # Process in descending order to avoid $1 replacing part of $10
-    if isinstance(args_value, str):
-        args_list = args_value.split()
-        for i in range(len(args_list) - 1, -1, -1):
-            text = text.replace(f"$ARGUMENTS[{i}]", args_list[i])
-            text = text.replace(f"${i}", args_list[i])
-    
-    # Replace $ARGUMENTS LAST (after indexed forms)
-    text = text.replace("$ARGUMENTS", str(args_value))
-    
-    return text
+    args_str = str(args_value)
+    words = args_value.split() if isinstance(args_value, str) else None
+
+    def _sub(match: re.Match) -> str:
+        index = match.group(1)
+        if index is not None:  # $ARGUMENTS[N]
+            if words is not None and int(index) < len(words):
+                return words[int(index)]
+            # Out of range / non-string args: the $ARGUMENTS prefix still
+            # substitutes, leaving the bracket suffix in place
+            return f"{args_str}[{index}]"
+        index = match.group(2)
+        if index is not None:  # $N
+            if words is not None and int(index) < len(words):
+                return words[int(index)]
+            return match.group(0)
+        return args_str  # bare $ARGUMENTS
+
+    return _ARG_PATTERN.sub(_sub, text)
 
 
 def build_prompt(module: dict, input_data: dict, use_envelope: bool = False, use_v22: bool = False) -> str:
@@ -683,22 +791,37 @@ def build_prompt(module: dict, input_data: dict, use_envelope: bool = False, use
 # LLM Response Parsing
 # =============================================================================
 
-def parse_llm_response(response: str) -> dict:
-    """Parse LLM response, handling potential markdown code blocks."""
+def parse_llm_response(response: Union[str, bytes]) -> dict:
+    """Parse LLM response, handling potential markdown code blocks.
+
+    Accepts str or bytes: raw provider payloads parse straight from the
+    buffer (orjson reads bytes natively, skipping an intermediate decode);
+    bytes only get decoded on the rare markdown-fence fallback.
+    """
+    if isinstance(response, (bytes, bytearray)):
+        try:
+            return _json_loads(response)
+        except json.JSONDecodeError:
+            response = response.decode("utf-8")
+
     text = response.strip()
-    
-    # Remove markdown code blocks if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        start = 1
-        end = len(lines) - 1
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == "```":
-                end = i
-                break
-        text = "\n".join(lines[start:end])
-    
-    return json.loads(text)
+
+    # Fast path: the response usually is bare JSON already
+    try:
+        return _json_loads(text)
+    except json.JSONDecodeError:
+        if not text.startswith("```"):
+            raise
+
+    # Remove the markdown code fence and retry
+    lines = text.split("\n")
+    start = 1
+    end = len(lines) - 1
+    for i, line in enumerate(lines[1:], 1):
+        if line.strip() == "```":
+            end = i
+            break
+    return _json_loads("\n".join(lines[start:end]))
 
 
 # =============================================================================
@@ -1164,29 +1287,33 @@ def run_module_stream(
 # Convenience Functions
 # =============================================================================
 
+# Prototype for envelopes without meta; copied on use so callers can mutate.
+_DEFAULT_META: EnvelopeMeta = {
+    "confidence": 0.5,
+    "risk": "medium",
+    "explain": "No meta available"
+}
+
+
 def extract_meta(result: EnvelopeResponseV22) -> EnvelopeMeta:
     """Extract meta from v2.2 envelope for routing/logging."""
-    return result.get("meta", {
-        "confidence": 0.5,
-        "risk": "medium",
-        "explain": "No meta available"
-    })
+    meta = result.get("meta")
+    # dict.get with a literal default would rebuild the fallback dict on
+    # every call, hit or miss; copying the prototype only on miss doesn't.
+    return meta if meta is not None else dict(_DEFAULT_META)
 
 
 def should_escalate(result: EnvelopeResponseV22, confidence_threshold: float = 0.7) -> bool:
     """Determine if result should be escalated to human review based on meta."""
-    meta = extract_meta(result)
-    
-    # Escalate if low confidence
-    if meta.get("confidence", 0) < confidence_threshold:
-        return True
-    
-    # Escalate if high risk
-    if meta.get("risk") == "high":
-        return True
-    
-    # Escalate if error
+    # Cheapest checks first: errors and explicit high risk short-circuit
+    # before the float comparison. Reads meta in place (no defensive copy).
     if not result.get("ok"):
         return True
-    
-    return False
+
+    meta = result.get("meta")
+    if meta is None:
+        meta = _DEFAULT_META
+    return (
+        meta.get("risk") == "high"
+        or meta.get("confidence", 0) < confidence_threshold
+    )
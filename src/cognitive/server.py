@@ -18,14 +18,23 @@ Cognitive Modules HTTP API Server
 """
 
 from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import APIKeyHeader
+
+try:
+    # orjson serializes responses 3-10x faster than the stdlib json encoder
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _DefaultResponseClass
+except ImportError:
+    from fastapi.responses import JSONResponse as _DefaultResponseClass
 from pydantic import BaseModel, Field
 from typing import Optional, Any, Dict, List
 import os
 
-from .registry import list_modules, find_module
+from .registry import list_modules, find_module, get_search_paths
 from .loader import load_module
+from .providers import _MODEL_VAR, _PROVIDER_VAR
 from .runner import run_module as execute_module
 
 # ============================================================
@@ -74,6 +83,7 @@ app = FastAPI(
     version="0.4.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=_DefaultResponseClass,
 )
 
 # CORS 配置
@@ -165,12 +175,33 @@ async def health():
     )
 
 
+# 模块列表缓存：按搜索目录的 mtime 失效（安装/卸载模块会更新目录 mtime）
+_modules_cache: Optional[tuple] = None
+
+
+def _search_paths_stamp() -> tuple:
+    """Fingerprint the module search directories by mtime_ns."""
+    stamps = []
+    for base_path in get_search_paths():
+        try:
+            stamps.append(base_path.stat().st_mtime_ns)
+        except OSError:
+            stamps.append(-1)
+    return tuple(stamps)
+
+
 @app.get("/modules", response_model=ModuleListResponse, tags=["Modules"])
 async def get_modules():
     """列出所有已安装模块"""
+    global _modules_cache
+
+    stamp = _search_paths_stamp()
+    if _modules_cache is not None and _modules_cache[0] == stamp:
+        return _modules_cache[1]
+
     modules_data = list_modules()
     modules = []
-    
+
     for m in modules_data:
         try:
             module = load_module(m["name"])
@@ -189,7 +220,9 @@ async def get_modules():
                 path=m["path"],
             ))
     
-    return ModuleListResponse(modules=modules, count=len(modules))
+    response = ModuleListResponse(modules=modules, count=len(modules))
+    _modules_cache = (stamp, response)
+    return response
 
 
 @app.get("/modules/{name}", response_model=ModuleInfo, tags=["Modules"])
@@ -240,20 +273,15 @@ async def run_module(
     module_path = find_module(request.module)
     if not module_path:
         raise HTTPException(status_code=404, detail=f"Module '{request.module}' not found")
-    
-    # 设置 provider（如果指定）
-    original_provider = os.environ.get("LLM_PROVIDER")
-    original_model = os.environ.get("LLM_MODEL")
-    
+
+    # 通过 contextvar 设置 provider/model（请求级隔离，不修改进程全局环境变量）
+    provider_token = _PROVIDER_VAR.set(request.provider) if request.provider else None
+    model_token = _MODEL_VAR.set(request.model) if request.model else None
+
     try:
-        if request.provider:
-            os.environ["LLM_PROVIDER"] = request.provider
-        if request.model:
-            os.environ["LLM_MODEL"] = request.model
-        
-        # 执行模块
-        result = execute_module(request.module, args=request.args)
-        
+        # 在线程池中执行模块，避免阻塞事件循环（LLM 调用可能耗时数十秒）
+        result = await run_in_threadpool(execute_module, request.module, args=request.args)
+
         return RunResponse(
             ok=True,
             data=result,
@@ -268,16 +296,10 @@ async def run_module(
             provider=request.provider,
         )
     finally:
-        # 恢复原始环境变量
-        if original_provider:
-            os.environ["LLM_PROVIDER"] = original_provider
-        elif "LLM_PROVIDER" in os.environ and request.provider:
-            del os.environ["LLM_PROVIDER"]
-        
-        if original_model:
-            os.environ["LLM_MODEL"] = original_model
-        elif "LLM_MODEL" in os.environ and request.model:
-            del os.environ["LLM_MODEL"]
+        if provider_token:
+            _PROVIDER_VAR.reset(provider_token)
+        if model_token:
+            _MODEL_VAR.reset(model_token)
 
 
 # ============================================================
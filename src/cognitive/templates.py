@@ -5,6 +5,18 @@ Module Templates - Generate skeleton for new cognitive modules.
 import json
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(obj: dict) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
 MODULE_MD_TEMPLATE = '''---
 name: {name}
 version: 1.0.0
@@ -79,6 +91,11 @@ EXAMPLE_OUTPUT = {
     "confidence": 0.8
 }
 
+# Example files are constant per template version - serialize them once at
+# import time instead of on every create_module call.
+_EXAMPLE_INPUT_BYTES = _dump_json_bytes(EXAMPLE_INPUT)
+_EXAMPLE_OUTPUT_BYTES = _dump_json_bytes(EXAMPLE_OUTPUT)
+
 
 def get_schema_template(name: str) -> dict:
     """Generate schema template as dict."""
@@ -156,31 +173,22 @@ def create_module(
     module_path = target_dir / name
     module_path.mkdir(parents=True, exist_ok=True)
     
-    # Create MODULE.md
+    # Create MODULE.md (single encode pass)
     module_md = MODULE_MD_TEMPLATE.format(
         name=name,
         responsibility=responsibility,
     )
-    (module_path / "MODULE.md").write_text(module_md, encoding='utf-8')
+    (module_path / "MODULE.md").write_bytes(module_md.encode('utf-8'))
     
     # Create schema.json
     schema = get_schema_template(name)
-    (module_path / "schema.json").write_text(
-        json.dumps(schema, indent=2, ensure_ascii=False),
-        encoding='utf-8'
-    )
-    
+    (module_path / "schema.json").write_bytes(_dump_json_bytes(schema))
+
     # Create examples
     if with_examples:
         examples_path = module_path / "examples"
         examples_path.mkdir(exist_ok=True)
-        (examples_path / "input.json").write_text(
-            json.dumps(EXAMPLE_INPUT, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
-        (examples_path / "output.json").write_text(
-            json.dumps(EXAMPLE_OUTPUT, indent=2, ensure_ascii=False),
-            encoding='utf-8'
-        )
+        (examples_path / "input.json").write_bytes(_EXAMPLE_INPUT_BYTES)
+        (examples_path / "output.json").write_bytes(_EXAMPLE_OUTPUT_BYTES)
     
     return module_path
@@ -11,10 +11,15 @@ Usage:
     python validate.py --level 2
 """
 
+import argparse
+import functools
 import json
+import os
 import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 try:
     import jsonschema
@@ -22,9 +27,26 @@ except ImportError:
     print("Error: jsonschema not installed. Run: pip install jsonschema")
     sys.exit(1)
 
+try:
+    # 3-10x faster parsing; decodes UTF-8 from bytes directly
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _json_loads = json.loads
 
+try:
+    # Optional compiled validator used as a fast-accept path in the hot
+    # per-vector loop; rejects fall back to jsonschema for its messages.
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+
+@functools.lru_cache(maxsize=1)
 def find_spec_dir() -> Path:
-    """Find the spec directory containing test vectors."""
+    """Find the spec directory containing test vectors (memoized)."""
     # Try relative paths from template location
     candidates = [
         Path(__file__).parent.parent.parent / "spec",  # When in templates/runtime-starter/
@@ -46,18 +68,65 @@ def find_spec_dir() -> Path:
     return None
 
 
+# Vector listings keyed by (dir, mtime_ns); repeated runs in one process
+# skip the filesystem walk until the tree changes.
+_VECTOR_LISTING_CACHE: Dict[Tuple[str, int], List[Path]] = {}
+
+
+def _iter_json(root) -> Iterator[str]:
+    """Yield paths of all *.json files under root via iterative scandir.
+
+    scandir exposes the entry type from the directory read itself, so no
+    per-entry stat syscall is needed (unlike pathlib's recursive glob).
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield entry.path
+
+
+def _list_test_vectors(test_vectors_dir: Path) -> List[Path]:
+    """List *.json vectors, cached per directory mtime."""
+    key = (str(test_vectors_dir), test_vectors_dir.stat().st_mtime_ns)
+    cached = _VECTOR_LISTING_CACHE.get(key)
+    if cached is None:
+        cached = sorted(Path(p) for p in _iter_json(test_vectors_dir))
+        _VECTOR_LISTING_CACHE.clear()
+        _VECTOR_LISTING_CACHE[key] = cached
+    return cached
+
+
 class EnvelopeValidator:
     """Validates envelopes against the response-envelope.schema.json."""
     
     def __init__(self, schema: dict):
         self.schema = schema
-    
+        # Compile once: jsonschema.validate rebuilds the validator (and
+        # re-resolves refs) on every call, which dominates batch runs.
+        jsonschema.Draft7Validator.check_schema(schema)
+        self._validator = jsonschema.Draft7Validator(schema)
+        self._fast_validate = None
+        if fastjsonschema is not None:
+            try:
+                self._fast_validate = fastjsonschema.compile(schema)
+            except Exception:
+                self._fast_validate = None
+
     def validate(self, envelope: dict) -> Tuple[bool, str]:
-        try:
-            jsonschema.validate(envelope, self.schema)
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(envelope)
+                return True, ""
+            except fastjsonschema.JsonSchemaException:
+                pass  # fall through for the jsonschema error message
+        error = next(self._validator.iter_errors(envelope), None)
+        if error is None:
             return True, ""
-        except jsonschema.ValidationError as e:
-            return False, str(e.message)
+        return False, str(error.message)
 
 
 def run_tests(spec_dir: Path, max_level: int = 3, verbose: bool = False) -> bool:
@@ -69,71 +138,75 @@ def run_tests(spec_dir: Path, max_level: int = 3, verbose: bool = False) -> bool
         print(f"Error: Schema not found: {schema_path}")
         return False
     
-    with open(schema_path) as f:
-        schema = json.load(f)
+    schema = _json_loads(schema_path.read_bytes())
     
     validator = EnvelopeValidator(schema)
     
     # Find test vectors
     test_vectors_dir = spec_dir / "test-vectors"
-    results: List[Dict[str, Any]] = []
-    
-    for test_file in sorted(test_vectors_dir.glob("**/*.json")):
-        if test_file.name.endswith(".md"):
-            continue
-        
-        with open(test_file) as f:
-            test_data = json.load(f)
-        
+
+    def run_one(test_file: Path) -> Optional[Tuple[str, str, str, bool, bool, str]]:
+        test_data = _json_loads(test_file.read_bytes())
+
         test_meta = test_data.get("$test", {})
         envelope = test_data.get("envelope", {})
-        
+
         level = test_meta.get("conformance_level", 1)
         if level > max_level:
-            continue
-        
+            return None
+
         expects = test_meta.get("expects", "accept")
         is_valid, error = validator.validate(envelope)
-        
+
         # Test passes if: (expects accept AND is valid) OR (expects reject AND is invalid)
         passed = (expects == "accept") == is_valid
-        
-        results.append({
-            "file": test_file.name,
-            "name": test_meta.get("name", test_file.stem),
-            "expects": expects,
-            "passed": passed,
-            "is_valid": is_valid,
-            "error": error
-        })
-    
+
+        return (test_file.name, test_meta.get("name", test_file.stem),
+                expects, passed, is_valid, error)
+
+    # File reads dominate; overlap them with a thread pool. executor.map
+    # preserves input order, so output stays deterministic.
+    test_files = _list_test_vectors(test_vectors_dir)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        rows = [r for r in pool.map(run_one, test_files) if r]
+
+    # Struct-of-arrays layout: parallel lists instead of a dict per vector.
+    # passed uses a byte array so the summary counts run at C speed.
+    files: List[str] = [r[0] for r in rows]
+    names: List[str] = [r[1] for r in rows]
+    expect_list: List[str] = [r[2] for r in rows]
+    passed_arr = array("b", (r[3] for r in rows))
+    is_valid_arr = array("b", (r[4] for r in rows))
+    errors: List[str] = [r[5] for r in rows]
+
     # Print results
     print("\n" + "=" * 60)
     print("Cognitive Modules Test Vector Validation")
     print("=" * 60)
-    
-    valid_tests = [r for r in results if "valid" in r["file"].lower() and "invalid" not in r["file"].lower()]
-    invalid_tests = [r for r in results if "invalid" in r["file"].lower()]
-    
-    def print_group(tests: List[Dict], title: str):
+
+    valid_idx = [i for i, f in enumerate(files)
+                 if "valid" in f.lower() and "invalid" not in f.lower()]
+    invalid_idx = [i for i, f in enumerate(files) if "invalid" in f.lower()]
+
+    def print_group(indices: List[int], title: str):
         print(f"\n{title}")
         print("-" * 40)
-        for result in tests:
-            status = "✅ PASS" if result["passed"] else "❌ FAIL"
-            print(f"  {status}: {result['name']}")
-            if verbose and not result["passed"]:
-                print(f"         Expected: {result['expects']}")
-                print(f"         Valid: {result['is_valid']}")
-                if result["error"]:
-                    print(f"         Error: {result['error'][:80]}...")
-    
-    print_group(valid_tests, "Valid Envelopes (should be accepted)")
-    print_group(invalid_tests, "Invalid Envelopes (should be rejected)")
-    
+        for i in indices:
+            status = "✅ PASS" if passed_arr[i] else "❌ FAIL"
+            print(f"  {status}: {names[i]}")
+            if verbose and not passed_arr[i]:
+                print(f"         Expected: {expect_list[i]}")
+                print(f"         Valid: {bool(is_valid_arr[i])}")
+                if errors[i]:
+                    print(f"         Error: {errors[i][:80]}...")
+
+    print_group(valid_idx, "Valid Envelopes (should be accepted)")
+    print_group(invalid_idx, "Invalid Envelopes (should be rejected)")
+
     # Summary
-    passed = sum(1 for r in results if r["passed"])
-    failed = sum(1 for r in results if not r["passed"])
-    total = len(results)
+    total = len(passed_arr)
+    passed = passed_arr.count(1)
+    failed = total - passed
     
     print("\n" + "=" * 60)
     print(f"Results: {passed}/{total} passed, {failed} failed")
@@ -149,8 +222,6 @@ def run_tests(spec_dir: Path, max_level: int = 3, verbose: bool = False) -> bool
 
 
 def main():
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Validate against test vectors")
     parser.add_argument("--level", "-l", type=int, default=3,
                        help="Maximum conformance level (1-3)")
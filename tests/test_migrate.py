@@ -19,6 +19,13 @@ from cognitive.migrate import (
     _add_rationale_to_output,
 )
 
+# Minimal v1 schema used by several migration fixtures; serialized once
+# instead of per test case.
+_MIN_SCHEMA_JSON = json.dumps({"input": {}, "output": {}})
+
+# libyaml C loader when available (PyYAML's pure-Python parser otherwise)
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TestCreateV22Manifest:
     """Test manifest creation helpers."""
@@ -298,7 +305,7 @@ Do something useful.
 
         # Check module.yaml content
         with open(tmp_path / "module.yaml") as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YAML_SAFE_LOADER)
         
         assert manifest["name"] == "v1-module"
         assert manifest["tier"] == "decision"
@@ -323,7 +330,7 @@ excludes: []
 ---
 # Test
 """)
-        (tmp_path / "schema.json").write_text(json.dumps({"input": {}, "output": {}}))
+        (tmp_path / "schema.json").write_text(_MIN_SCHEMA_JSON)
 
         # Run dry migration
         success, changes, warnings = migrate_module(str(tmp_path), dry_run=True, backup=False)
@@ -378,7 +385,7 @@ excludes: []
 ---
 # Test
 """)
-        (module_dir / "schema.json").write_text(json.dumps({"input": {}, "output": {}}))
+        (module_dir / "schema.json").write_text(_MIN_SCHEMA_JSON)
 
         success, changes, warnings = migrate_module(str(module_dir), dry_run=False, backup=True)
 
@@ -415,7 +422,7 @@ policies:
 
         # Check module.yaml was updated
         with open(tmp_path / "module.yaml") as f:
-            manifest = yaml.safe_load(f)
+            manifest = yaml.load(f, Loader=_YAML_SAFE_LOADER)
         
         assert manifest["tier"] == "decision"
         assert "overflow" in manifest
@@ -456,7 +463,7 @@ excludes: []
 ---
 # Module 1
 """)
-        (mod1_path / "schema.json").write_text(json.dumps({"input": {}, "output": {}}))
+        (mod1_path / "schema.json").write_text(_MIN_SCHEMA_JSON)
 
         mod2_path = tmp_path / "mod2"
         mod2_path.mkdir()
@@ -468,7 +475,7 @@ excludes: []
 ---
 # Module 2
 """)
-        (mod2_path / "schema.json").write_text(json.dumps({"input": {}, "output": {}}))
+        (mod2_path / "schema.json").write_text(_MIN_SCHEMA_JSON)
 
         # Mock list_modules
         def mock_list_modules():
@@ -8,6 +8,8 @@ Includes tests for v2.2 features:
 """
 
 import json
+from types import MappingProxyType
+
 import pytest
 
 from cognitive.runner import (
@@ -17,6 +19,7 @@ from cognitive.runner import (
     parse_llm_response,
     # v2.2 Risk aggregation
     aggregate_risk,
+    aggregate_risk_batch,
     aggregate_risk_from_list,
     RISK_LEVELS,
     RISK_NAMES,
@@ -40,6 +43,33 @@ from cognitive.loader import (
 )
 
 
+# =============================================================================
+# Shared envelope fixtures
+# =============================================================================
+# Canonical envelopes built once per module instead of as per-test literals.
+# The frozen views double as a mutation guard: any function under test that
+# writes into a shared input raises TypeError instead of silently passing.
+
+@pytest.fixture(scope="module")
+def bare_v22():
+    """Success envelope with empty meta, as seen before the repair pass."""
+    return MappingProxyType({
+        "ok": True,
+        "meta": MappingProxyType({}),
+        "data": MappingProxyType({}),
+    })
+
+
+@pytest.fixture(scope="module")
+def base_v22():
+    """Well-formed v2.2 success envelope."""
+    return MappingProxyType({
+        "ok": True,
+        "meta": MappingProxyType({"confidence": 0.9, "risk": "low", "explain": "test"}),
+        "data": MappingProxyType({}),
+    })
+
+
 class TestValidateData:
     """Test JSON Schema validation."""
 
@@ -153,6 +183,16 @@ class TestParseLlmResponse:
         assert parsed["confidence"] == 0.95
         assert len(parsed["issues"]) == 1
 
+    def test_parse_bytes(self):
+        """Raw bytes payloads parse without an intermediate decode."""
+        parsed = parse_llm_response(b'{"result": "success"}')
+        assert parsed["result"] == "success"
+
+    def test_parse_bytes_markdown_code_block(self):
+        response = b'```json\n{"result": "success"}\n```'
+        parsed = parse_llm_response(response)
+        assert parsed["result"] == "success"
+
 
 # =============================================================================
 # v2.2 Risk Aggregation Tests
@@ -284,6 +324,52 @@ class TestAggregateRisk:
         assert result == "high"
 
 
+class TestAggregateRiskBatch:
+    """Test aggregate_risk_batch against per-item aggregate_risk."""
+
+    def test_empty_batch(self):
+        assert aggregate_risk_batch([]) == []
+
+    def test_explicit_rule_returns_medium_for_all(self):
+        data_list = [
+            {"changes": [{"risk": "high"}]},
+            {"changes": [{"risk": "low"}]},
+        ]
+        result = aggregate_risk_batch(data_list, "explicit")
+        assert result == ["medium", "medium"]
+
+    def test_max_issues_risk_uses_issues_key(self):
+        data_list = [
+            {
+                "issues": [{"risk": "high"}],
+                "changes": [{"risk": "none"}],  # Should be ignored
+            }
+        ]
+        result = aggregate_risk_batch(data_list, "max_issues_risk")
+        assert result == ["high"]
+
+    def test_missing_or_empty_items_default_to_medium(self):
+        data_list = [
+            {"rationale": "some text"},
+            {"changes": []},
+        ]
+        result = aggregate_risk_batch(data_list)
+        assert result == ["medium", "medium"]
+
+    def test_matches_per_item_aggregate_risk(self):
+        """Batch results must equal calling aggregate_risk per item."""
+        data_list = [
+            {"changes": [{"risk": "low"}, {"risk": "high"}]},
+            {"changes": [{"risk": "none"}]},
+            {"issues": [{"risk": "high"}]},
+            {},
+        ]
+        for rule in ("max_changes_risk", "max_issues_risk", "explicit"):
+            batched = aggregate_risk_batch(data_list, rule)
+            singles = [aggregate_risk(data, rule) for data in data_list]
+            assert batched == singles
+
+
 # =============================================================================
 # v2.2 Repair Pass Tests
 # =============================================================================
@@ -303,33 +389,21 @@ class TestRepairEnvelope:
         assert "risk" in repaired["meta"]
         assert "explain" in repaired["meta"]
 
-    def test_fill_confidence_from_data(self):
+    def test_fill_confidence_from_data(self, bare_v22):
         """Should extract confidence from data if missing in meta."""
-        data = {
-            "ok": True,
-            "meta": {},
-            "data": {"confidence": 0.85, "rationale": "test"}
-        }
+        data = {**bare_v22, "data": {"confidence": 0.85, "rationale": "test"}}
         repaired = repair_envelope(data)
         assert repaired["meta"]["confidence"] == 0.85
 
-    def test_default_confidence_when_missing(self):
+    def test_default_confidence_when_missing(self, bare_v22):
         """Should default to 0.5 if confidence not found anywhere."""
-        data = {
-            "ok": True,
-            "meta": {},
-            "data": {"rationale": "test"}
-        }
+        data = {**bare_v22, "data": {"rationale": "test"}}
         repaired = repair_envelope(data)
         assert repaired["meta"]["confidence"] == 0.5
 
-    def test_clamp_confidence_to_valid_range(self):
+    def test_clamp_confidence_to_valid_range(self, bare_v22):
         """Confidence should be clamped to [0, 1]."""
-        data = {
-            "ok": True,
-            "meta": {"confidence": 1.5},
-            "data": {}
-        }
+        data = {**bare_v22, "meta": {"confidence": 1.5}}
         repaired = repair_envelope(data)
         assert repaired["meta"]["confidence"] == 1.0
 
@@ -337,74 +411,49 @@ class TestRepairEnvelope:
         repaired = repair_envelope(data)
         assert repaired["meta"]["confidence"] == 0.0
 
-    def test_aggregate_risk_from_changes(self):
+    def test_aggregate_risk_from_changes(self, bare_v22):
         """Should aggregate risk from data.changes."""
-        data = {
-            "ok": True,
-            "meta": {},
-            "data": {
-                "changes": [
-                    {"risk": "low"},
-                    {"risk": "high"},
-                ],
-                "rationale": "test"
-            }
-        }
+        data = {**bare_v22, "data": {
+            "changes": [
+                {"risk": "low"},
+                {"risk": "high"},
+            ],
+            "rationale": "test"
+        }}
         repaired = repair_envelope(data)
         assert repaired["meta"]["risk"] == "high"
 
-    def test_trim_whitespace_from_risk(self):
+    def test_trim_whitespace_from_risk(self, bare_v22):
         """Should trim whitespace from risk value."""
-        data = {
-            "ok": True,
-            "meta": {"risk": "  LOW  "},
-            "data": {}
-        }
+        data = {**bare_v22, "meta": {"risk": "  LOW  "}}
         repaired = repair_envelope(data)
         assert repaired["meta"]["risk"] == "low"
 
-    def test_extract_explain_from_rationale(self):
+    def test_extract_explain_from_rationale(self, bare_v22):
         """Should create explain from rationale if missing."""
         rationale = "This is a detailed explanation " * 20  # Long text
-        data = {
-            "ok": True,
-            "meta": {},
-            "data": {"rationale": rationale}
-        }
+        data = {**bare_v22, "data": {"rationale": rationale}}
         repaired = repair_envelope(data)
         assert "explain" in repaired["meta"]
         assert len(repaired["meta"]["explain"]) <= 280
 
-    def test_truncate_long_explain(self):
+    def test_truncate_long_explain(self, bare_v22):
         """Should truncate explain to max 280 characters."""
         long_explain = "x" * 500
-        data = {
-            "ok": True,
-            "meta": {"explain": long_explain},
-            "data": {}
-        }
+        data = {**bare_v22, "meta": {"explain": long_explain}}
         repaired = repair_envelope(data)
         assert len(repaired["meta"]["explain"]) <= 280
         assert repaired["meta"]["explain"].endswith("...")
 
-    def test_trim_whitespace_from_explain(self):
+    def test_trim_whitespace_from_explain(self, bare_v22):
         """Should trim whitespace from explain."""
-        data = {
-            "ok": True,
-            "meta": {"explain": "  test explain  "},
-            "data": {}
-        }
+        data = {**bare_v22, "meta": {"explain": "  test explain  "}}
         repaired = repair_envelope(data)
         assert repaired["meta"]["explain"] == "test explain"
 
-    def test_default_explain_when_missing(self):
+    def test_default_explain_when_missing(self, bare_v22):
         """Should use default explain when nothing available."""
-        data = {
-            "ok": True,
-            "meta": {},
-            "data": {}
-        }
-        repaired = repair_envelope(data)
+        repaired = repair_envelope(bare_v22)
         assert repaired["meta"]["explain"] == "No explanation provided"
 
     def test_does_not_modify_original(self):
@@ -480,13 +529,8 @@ class TestIsEnvelopeResponse:
 class TestIsV22Envelope:
     """Test is_v22_envelope detection."""
 
-    def test_v22_envelope_with_meta(self):
-        data = {
-            "ok": True,
-            "meta": {"confidence": 0.9, "risk": "low", "explain": "test"},
-            "data": {}
-        }
-        assert is_v22_envelope(data) is True
+    def test_v22_envelope_with_meta(self, base_v22):
+        assert is_v22_envelope(dict(base_v22)) is True
 
     def test_v21_envelope_without_meta(self):
         data = {"ok": True, "data": {"confidence": 0.9}}
@@ -504,13 +548,9 @@ class TestIsV22Envelope:
 class TestWrapV21ToV22:
     """Test wrap_v21_to_v22 conversion."""
 
-    def test_already_v22_returns_with_version(self):
+    def test_already_v22_returns_with_version(self, base_v22):
         """Already v2.2 format should pass through with version added if missing."""
-        data = {
-            "ok": True,
-            "meta": {"confidence": 0.9, "risk": "low", "explain": "test"},
-            "data": {"rationale": "detailed"}
-        }
+        data = {**base_v22, "data": {"rationale": "detailed"}}
         result = wrap_v21_to_v22(data)
         # Should add version field
         assert result["version"] == "2.2"
@@ -518,14 +558,9 @@ class TestWrapV21ToV22:
         assert result["meta"] == data["meta"]
         assert result["data"] == data["data"]
     
-    def test_already_v22_with_version_unchanged(self):
+    def test_already_v22_with_version_unchanged(self, base_v22):
         """Already v2.2 format with version should pass through unchanged."""
-        data = {
-            "ok": True,
-            "version": "2.2",
-            "meta": {"confidence": 0.9, "risk": "low", "explain": "test"},
-            "data": {"rationale": "detailed"}
-        }
+        data = {**base_v22, "version": "2.2", "data": {"rationale": "detailed"}}
         result = wrap_v21_to_v22(data)
         assert result == data
 
@@ -8,11 +8,48 @@ Includes tests for v2.2 features:
 """
 
 import json
+import os
 from pathlib import Path
 
 import pytest
 
-from cognitive.validator import validate_module, validate_v22_envelope
+from cognitive.validator import (
+    validate_module,
+    validate_v22_envelope,
+    validate_v22_envelope_batch,
+)
+
+
+# Minimal v2.2 schema and prompt shared by the module-validation tests:
+# serialized once at import instead of rebuilt and re-dumped per test.
+_V22_SCHEMA_BYTES = json.dumps({
+    "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
+    "input": {},
+    "data": {"type": "object", "required": ["rationale"]}
+}).encode()
+
+_V22_PROMPT_MD = "# Test\nWith envelope format and meta.\n" * 5
+
+
+@pytest.fixture(scope="session")
+def golden_v22(tmp_path_factory):
+    """Shared prompt.md and schema.json, written to disk once per session."""
+    d = tmp_path_factory.mktemp("golden-v22")
+    (d / "prompt.md").write_text(_V22_PROMPT_MD)
+    (d / "schema.json").write_bytes(_V22_SCHEMA_BYTES)
+    return d
+
+
+@pytest.fixture
+def v22_module(golden_v22, tmp_path):
+    """Module dir pre-seeded with the golden prompt and schema.
+
+    Hardlinks avoid copying file data; each test writes only the
+    module.yaml it is actually exercising.
+    """
+    os.link(golden_v22 / "prompt.md", tmp_path / "prompt.md")
+    os.link(golden_v22 / "schema.json", tmp_path / "schema.json")
+    return tmp_path
 
 
 class TestValidateModule:
@@ -305,6 +342,70 @@ class TestValidateV22Envelope:
             assert is_valid is True, f"Risk '{risk}' should be valid"
 
 
+class TestValidateV22EnvelopeBatch:
+    """Test validate_v22_envelope_batch function."""
+
+    def test_empty_batch(self):
+        assert validate_v22_envelope_batch([]) == []
+
+    def test_all_valid_batch(self):
+        """Valid envelopes should come back (True, []) in order."""
+        responses = [
+            {
+                "ok": True,
+                "meta": {"confidence": 0.9, "risk": "low", "explain": "test"},
+                "data": {"rationale": "test"}
+            },
+            {
+                "ok": False,
+                "meta": {"confidence": 0.0, "risk": "high", "explain": "err"},
+                "error": {"code": "E1001", "message": "Invalid input"}
+            },
+        ]
+        results = validate_v22_envelope_batch(responses)
+        assert results == [(True, []), (True, [])]
+
+    def test_invalid_envelope_keeps_full_errors(self):
+        """Invalid envelopes should carry the same errors as the single call."""
+        response = {
+            "ok": True,
+            "meta": {"risk": "low", "explain": "test"},
+            "data": {"rationale": "test"}
+        }
+        results = validate_v22_envelope_batch([response])
+        assert results[0][0] is False
+        assert results[0][1] == validate_v22_envelope(response)[1]
+
+    def test_mixed_batch_matches_per_item_validation(self):
+        """Batch results must equal calling validate_v22_envelope per item."""
+        responses = [
+            {
+                "ok": True,
+                "meta": {"confidence": 0.9, "risk": "low", "explain": "test"},
+                "data": {"rationale": "test"}
+            },
+            {"ok": True, "data": {"rationale": "no meta"}},
+            {
+                "ok": True,
+                "meta": {"confidence": 0.9, "risk": "extreme", "explain": "t"},
+                "data": {}
+            },
+            {
+                "ok": False,
+                "meta": {"confidence": 0.0, "risk": "high", "explain": "err"},
+                "error": {"message": "missing code"}
+            },
+            {
+                "ok": True,
+                "meta": {"confidence": 1.0, "risk": "none", "explain": "x" * 280},
+                "data": {}
+            },
+        ]
+        batched = validate_v22_envelope_batch(responses)
+        singles = [validate_v22_envelope(response) for response in responses]
+        assert batched == singles
+
+
 # =============================================================================
 # v2.2 Module Format Validation Tests
 # =============================================================================
@@ -551,7 +652,7 @@ overflow:
   require_suggested_mapping: true
 """
         (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
+        (tmp_path / "prompt.md").write_text(_V22_PROMPT_MD)
         
         # Schema with $defs.extensions
         schema = {
@@ -596,15 +697,10 @@ overflow:
   max_items: 5
 """
         (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
+        (tmp_path / "prompt.md").write_text(_V22_PROMPT_MD)
         
         # Schema WITHOUT $defs.extensions
-        schema = {
-            "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
-            "input": {},
-            "data": {"type": "object", "required": ["rationale"]}
-        }
-        (tmp_path / "schema.json").write_text(json.dumps(schema))
+        (tmp_path / "schema.json").write_bytes(_V22_SCHEMA_BYTES)
 
         is_valid, errors, warnings = validate_module(str(tmp_path), v22=True)
         
@@ -625,7 +721,7 @@ overflow:
   # require_suggested_mapping not set
 """
         (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
+        (tmp_path / "prompt.md").write_text(_V22_PROMPT_MD)
         schema = {
             "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
             "input": {},
@@ -639,7 +735,7 @@ overflow:
         # Should have warning about require_suggested_mapping
         assert any("require_suggested_mapping" in w for w in warnings)
 
-    def test_overflow_disabled_no_extensions_required(self, tmp_path):
+    def test_overflow_disabled_no_extensions_required(self, v22_module):
         """Overflow disabled should not require $defs.extensions."""
         module_yaml = """
 name: no-overflow-module
@@ -650,16 +746,9 @@ tier: exec
 overflow:
   enabled: false
 """
-        (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
-        schema = {
-            "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
-            "input": {},
-            "data": {"type": "object", "required": ["rationale"]}
-        }
-        (tmp_path / "schema.json").write_text(json.dumps(schema))
+        (v22_module / "module.yaml").write_text(module_yaml)
 
-        is_valid, errors, warnings = validate_module(str(tmp_path), v22=True)
+        is_valid, errors, warnings = validate_module(str(v22_module), v22=True)
         
         # Should not warn about extensions when overflow disabled
         assert not any("extensions" in w.lower() for w in warnings)
@@ -672,7 +761,7 @@ overflow:
 class TestEnumStrategyValidation:
     """Test enum strategy validation."""
 
-    def test_valid_strict_strategy(self, tmp_path):
+    def test_valid_strict_strategy(self, v22_module):
         """Strict enum strategy should pass."""
         module_yaml = """
 name: strict-enum-module
@@ -683,20 +772,13 @@ tier: exec
 enums:
   strategy: strict
 """
-        (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
-        schema = {
-            "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
-            "input": {},
-            "data": {"type": "object", "required": ["rationale"]}
-        }
-        (tmp_path / "schema.json").write_text(json.dumps(schema))
+        (v22_module / "module.yaml").write_text(module_yaml)
 
-        is_valid, errors, warnings = validate_module(str(tmp_path), v22=True)
+        is_valid, errors, warnings = validate_module(str(v22_module), v22=True)
         
         assert is_valid is True, f"Errors: {errors}"
 
-    def test_valid_extensible_strategy(self, tmp_path):
+    def test_valid_extensible_strategy(self, v22_module):
         """Extensible enum strategy should pass."""
         module_yaml = """
 name: extensible-enum-module
@@ -707,20 +789,13 @@ tier: decision
 enums:
   strategy: extensible
 """
-        (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
-        schema = {
-            "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
-            "input": {},
-            "data": {"type": "object", "required": ["rationale"]}
-        }
-        (tmp_path / "schema.json").write_text(json.dumps(schema))
+        (v22_module / "module.yaml").write_text(module_yaml)
 
-        is_valid, errors, warnings = validate_module(str(tmp_path), v22=True)
+        is_valid, errors, warnings = validate_module(str(v22_module), v22=True)
         
         assert is_valid is True, f"Errors: {errors}"
 
-    def test_invalid_enum_strategy(self, tmp_path):
+    def test_invalid_enum_strategy(self, v22_module):
         """Invalid enum strategy should fail."""
         module_yaml = """
 name: bad-enum-module
@@ -731,16 +806,9 @@ tier: decision
 enums:
   strategy: invalid_strategy
 """
-        (tmp_path / "module.yaml").write_text(module_yaml)
-        (tmp_path / "prompt.md").write_text("# Test\nWith envelope format and meta.\n" * 5)
-        schema = {
-            "meta": {"type": "object", "required": ["confidence", "risk", "explain"]},
-            "input": {},
-            "data": {"type": "object", "required": ["rationale"]}
-        }
-        (tmp_path / "schema.json").write_text(json.dumps(schema))
+        (v22_module / "module.yaml").write_text(module_yaml)
 
-        is_valid, errors, warnings = validate_module(str(tmp_path), v22=True)
+        is_valid, errors, warnings = validate_module(str(v22_module), v22=True)
         
         assert is_valid is False
         assert any("strategy" in e.lower() for e in errors)